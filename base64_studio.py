@@ -0,0 +1,1774 @@
+# -*- coding: utf-8 -*-
+import sys
+import os
+import base64
+import io
+import zipfile
+import shutil
+import logging
+import zlib
+import queue
+import threading
+import time
+from contextlib import closing
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import tempfile
+
+try:
+    # Optional: pybase64 dispatches to libbase64's SIMD kernels; same API as the stdlib, but with
+    # validate=False it rejects "=" inside the data where the stdlib stops decoding there
+    import pybase64 as _b64
+except ImportError:
+    _b64 = base64
+
+try:
+    # Optional: libdeflate compresses whole buffers about twice as fast as zlib
+    import deflate as _libdeflate
+except ImportError:
+    _libdeflate = None
+
+try:
+    # Optional: ISA-L computes CRC32 with carry-less multiply instructions, several times zlib's rate
+    from isal.isal_zlib import crc32
+except ImportError:
+    from zlib import crc32
+
+# Tracebacks are logged; message boxes only show the error text
+log = logging.getLogger(__name__)
+
+from PyQt5.QtCore import Qt, QObject, pyqtSignal, QRunnable, QThreadPool, QTimer
+from PyQt5.QtWidgets import QProgressDialog
+
+from PyQt5.QtWidgets import (
+    QApplication,
+    QWidget,
+    QVBoxLayout,
+    QPushButton,
+    QFileDialog,
+    QTextEdit,
+    QPlainTextEdit,
+    QLabel,
+    QMessageBox,
+    QGroupBox,
+    QHBoxLayout,
+    QComboBox,
+)
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QIcon
+
+
+def resource_path(relative_path):
+    """Get the absolute path to resource (supports PyInstaller environment)"""
+    if hasattr(sys, "_MEIPASS"):
+        # PyInstaller creates a temp folder and stores path in _MEIPASS
+        return os.path.join(sys._MEIPASS, relative_path)
+    return os.path.join(os.path.abspath("."), relative_path)
+
+
+ICON_PATH = resource_path("icon.ico")  # Resolved once; every window shares the same icon
+_APP_ICON = None  # QIcon needs a QApplication, so it is built on first use
+
+
+def app_icon():
+    """Returns the shared window icon, or None when icon.ico is missing"""
+    global _APP_ICON
+    if _APP_ICON is None and os.path.exists(ICON_PATH):
+        _APP_ICON = QIcon(ICON_PATH)
+    return _APP_ICON
+
+
+# --- Translations ---
+LANG = "en"  # UI language; set by main() before any widget is built
+
+# English strings are the keys; a missing translation falls back to the English text
+_STRINGS = {
+    "en": {},
+    "zh": {
+        "Fast": "快速",
+        "Default": "預設",
+        "Small": "最小",
+        "Store (no compression)": "不壓縮",
+        "Copy": "複製",
+        "Ready...": "準備就緒...",
+        "Ready... Base64 codec: pybase64 {version}": "準備就緒... Base64 編解碼器：pybase64 {version}",
+        "File Compression & Decoding (Standard)": "檔案壓縮與解碼（一般）",
+        "Select Files → Compress → Base64": "選檔案壓縮 → Base64",
+        "Select Folder → Compress → Base64": "選資料夾壓縮 → Base64",
+        "Base64 → Decode to File...": "Base64 → 解碼為檔案...",
+        "Large File Processing (Stream Save/Load Base64.txt)": (
+            "大檔案處理專區（專為大檔案，直接存成 Base64.txt / 從 Base64.txt 解碼）"
+        ),
+        "Select Files → Save Base64.txt": "選檔案壓縮 → 儲存 Base64.txt",
+        "Select Folder → Save Base64.txt": "選資料夾壓縮 → 儲存 Base64.txt",
+        "Decode from Base64.txt to File": "從 Base64.txt 解碼為檔案",
+        "Success": "成功",
+        "Operation completed!": "作業完成！",
+        "Error": "錯誤",
+        "Processing failed": "處理失敗",
+        "Canceled": "已取消",
+        "Operation stopped and partial files cleaned up.": "已停止並清除半成品。",
+        "Operation canceled": "操作已取消",
+        "Cancel": "取消",
+        "Save as ZIP File": "另存為 ZIP 檔案",
+        "ZIP Files (*.zip);;All Files (*)": "ZIP 檔案 (*.zip);;所有檔案 (*)",
+        "Processing (Non-blocking UI)...": "處理中（不會卡 UI）…",
+        "Preparing...": "準備中…",
+        "File saved:\n{path}": "檔案已儲存：\n{path}",
+        "Saved: {name}": "已儲存：{name}",
+        "Select Extraction Folder": "選擇解壓縮資料夾",
+        "{head}\n…[{omitted:,} chars omitted]…\n{tail}": (
+            "{head}\n…[{omitted:,} 個字元已省略]…\n{tail}"
+        ),
+        "Select Files": "選擇檔案",
+        "Compressed {count} files": "已壓縮 {count} 個檔案",
+        "Select Folder": "選擇資料夾",
+        "Compressed folder: {name}": "已壓縮資料夾：{name}",
+        "Select Files to Compress (Multi-select supported)": "選擇要壓縮的檔案（可多選）",
+        "Save as Base64.txt": "儲存為 Base64.txt",
+        "Text Files (*.txt);;All Files (*)": "文字檔 (*.txt);;所有檔案 (*)",
+        "Select Folder to Compress": "選擇要壓縮的資料夾",
+        "Select Base64.txt File (Generated by Large File Section)": (
+            "選擇 Base64.txt 檔案（由大檔案專區產生）"
+        ),
+        "Compressing files/folders...": "正在壓縮檔案/資料夾…",
+        "Decoding Base64 (Reading)...": "正在解碼 Base64（讀取中）…",
+        "Validating ZIP file...": "正在驗證 ZIP 檔…",
+        "Saving ZIP file...": "正在儲存 ZIP 檔…",
+        "Extracting ZIP file...": "正在解壓縮 ZIP 檔…",
+        "Extraction stopped; files already extracted were kept.": (
+            "已停止解壓縮；已解壓縮的檔案會保留。"
+        ),
+        "Input Area: (Enter Text or Base64 String)": "輸入區：(輸入文字或 Base64 字串)",
+        "Base64 Encoded Output:": "Base64 編碼輸出：",
+        "Text Decoded Output:": "文字解碼輸出：",
+        "Compression:": "壓縮等級：",
+        "Save operation canceled": "儲存操作已取消",
+        "Extraction operation canceled": "解壓縮操作已取消",
+        "Extracted {count} files to:\n{path}": "已解壓縮 {count} 個檔案至：\n{path}",
+        "Extracted to: {name}": "已解壓縮至：{name}",
+        "Base64 output copied to clipboard!": "Base64 輸出已複製到剪貼簿！",
+        "Base64 output area is empty, nothing to copy.": "Base64 輸出區為空，無可複製內容。",
+        "Text decoded output copied to clipboard!": "文字解碼輸出已複製到剪貼簿！",
+        "Text decoded output area is empty, nothing to copy.": "文字解碼輸出區為空，無可複製內容。",
+        "Convert": "轉換",
+        "Converting...": "轉換中...",
+        "Input too large for real-time conversion; press \"Convert\" to convert it": (
+            "輸入過大，已停用即時轉換；請按「轉換」進行轉換"
+        ),
+        "Real-time conversion complete": "即時轉換完成",
+        "Result Too Large": "結果過大",
+        "Base64 length is {length}, too large to display.\nPlease choose where to save Base64.txt.": (
+            "Base64 長度為 {length}，過大無法顯示。\n請選擇 Base64.txt 的儲存位置。"
+        ),
+        "{summary}, Base64 saved: {name}": "{summary}，已儲存 Base64：{name}",
+        "Please paste Base64 encoding in the input area.": "請在輸入區貼上 Base64 編碼。",
+        "Select Operation": "請選擇操作",
+        "Successfully validated as a ZIP archive. What would you like to do?": (
+            "已成功驗證為 ZIP 壓縮檔，您想如何處理？"
+        ),
+        "Extract Directly to Folder": "直接解壓縮到資料夾",
+        "Save Base64.txt canceled": "儲存 Base64.txt 已取消",
+        "Decoded content is not a valid ZIP archive.": "解碼後內容不是有效的 ZIP 壓縮檔。",
+        "Extraction Failed": "解壓縮失敗",
+        "Extraction failed": "解壓縮失敗",
+        "Error during conversion": "轉換時發生錯誤",
+        "{summary}, Base64 length: {length}": "{summary}，Base64 長度：{length}",
+        "Compression failed": "壓縮失敗",
+        "Base64 saved: {name}": "已儲存 Base64：{name}",
+        "Error compressing file: {path}\n{error}": "壓縮檔案時發生錯誤：{path}\n{error}",
+    },
+}
+
+
+def T(text):
+    """Returns text translated to the current UI language"""
+    return _STRINGS[LANG].get(text, text)
+
+
+# --- Constants and QSS Style ---
+QSS_STYLE = """
+    QWidget {
+        background-color: #2e2e2e;
+        color: #f0f0f0;
+        font-family: "Microsoft JhengHei";
+        font-size: 14px;
+    }
+    QPushButton {
+        background-color: #444;
+        color: white;
+        padding: 8px 16px;
+        border-radius: 6px;
+    }
+    QPushButton:disabled {
+        background-color: #222;
+        color: #888;
+    }
+    QPushButton:hover:!disabled {
+        background-color: #666;
+    }
+    QPushButton#CopyButton {
+        padding: 4px 12px;
+        font-size: 12px;
+        font-weight: bold;
+    }
+    QTextEdit, QPlainTextEdit {
+        background-color: #1e1e1e;
+        color: #f0f0f0;
+        border: 1px solid #555;
+        border-radius: 4px;
+        padding: 4px;
+    }
+    QComboBox {
+        background-color: #444;
+        color: white;
+        padding: 4px 8px;
+        border-radius: 4px;
+    }
+    QLabel {
+        font-weight: bold;
+    }
+    QGroupBox {
+        border: 1px solid #555;
+        border-radius: 4px;
+        margin-top: 10px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        subcontrol-position: top center;
+        padding: 0 3px;
+    }
+"""
+
+
+# --- Core Functions (Text) ---
+def encode_text_to_base64(text: str) -> str:
+    """Encodes text to a Base64 string."""
+    data = text.encode("utf-8")
+    if _b64 is not base64:
+        # pybase64 builds the str directly, skipping the intermediate bytes and its decode
+        return _b64.b64encode_as_string(data)
+    # Base64 output is pure ASCII, so the cheaper ASCII codec is enough
+    return base64.b64encode(data).decode("ascii")
+
+
+BINARY_SNIFF_SIZE = 4096  # Decoded bytes checked for NULs before the text panel runs the UTF-8 codec
+CONTROL_SNIFF_SIZE = 512  # Decoded bytes checked for control characters
+CONTROL_SNIFF_LIMIT = 32  # More control characters than this in that window means binary
+TEXT_CONTROL_BYTES = bytes(set(range(32)) - set(b"\t\n\v\f\r"))  # Control bytes rare in real text
+
+
+def looks_binary(data: bytes) -> bool:
+    """Sniffs the head of data for NUL bytes or many control characters, like file(1) does"""
+    if b"\x00" in data[:BINARY_SNIFF_SIZE]:
+        return True
+    head = data[:CONTROL_SNIFF_SIZE]
+    # Control bytes other than tab, newline, vertical tab, form feed and carriage return
+    return len(head) - len(head.translate(None, TEXT_CONTROL_BYTES)) > CONTROL_SNIFF_LIMIT
+
+
+def decode_base64_to_text(base64_str: str) -> str:
+    """Decodes a Base64 string to text, ignoring decoding errors."""
+    # Non-ASCII characters can never be valid Base64; drop them instead of running the UTF-8 codec,
+    # then drop what b64decode would skip anyway
+    data = base64_str.encode("ascii", "ignore").translate(None, NON_BASE64_BYTES)
+    if len(data) % 4 and b"=" not in data:
+        # Most plain text lands here: unpadded and not 4-aligned, it cannot decode, so skip the exception
+        return ""
+    decode = _b64.b64decode
+    pad = data.find(b"=")
+    if pad != -1 and data.count(b"=", pad) != len(data) - pad:
+        # "=" inside the data: the stdlib stops at the first complete padding group while pybase64
+        # rejects the input, so use the stdlib to keep the result independent of the backend
+        decode = base64.b64decode
+    try:
+        raw = decode(data, validate=False)
+        if looks_binary(raw):
+            # e.g. a pasted ZIP: decoding megabytes of it would only fill the panel with garbage
+            return ""
+        return raw.decode("utf-8", errors="ignore")
+    except Exception:
+        return ""
+
+
+# --- Recursive Compression Utility ---
+# Already-compressed formats: deflating them again only burns CPU (and can grow them slightly)
+STORED_EXTS = {
+    ".zip", ".gz", ".xz", ".7z", ".zst", ".bz2", ".rar",
+    ".jpg", ".jpeg", ".png", ".gif", ".webp",
+    ".mp4", ".mov", ".mkv", ".webm", ".mp3", ".flac",
+    ".pdf", ".docx", ".xlsx", ".pptx",  # Office documents are ZIP archives themselves
+}
+ZIP_COMPRESSLEVEL = 1  # Default deflate level: several times the throughput of level 6 for a slightly larger ZIP
+COMPRESSION_LEVELS = [  # Compression combo box entries: (label, deflate level); None stores without compression
+    ("Fast", 1),
+    ("Default", 6),
+    ("Small", 9),
+    ("Store (no compression)", None),
+]
+PARALLEL_MAX_FILE_SIZE = 4 * 1024 * 1024  # Larger files are streamed instead of deflated whole in a worker
+
+
+def zip_info_for(zipf, abs_path, arcname):
+    """Builds the ZipInfo for a streamed entry; already-compressed formats are stored without deflate"""
+    info = zipfile.ZipInfo.from_file(abs_path, arcname)
+    if os.path.splitext(abs_path)[1].lower() in STORED_EXTS:
+        info.compress_type = zipfile.ZIP_STORED
+    else:
+        info.compress_type = zipf.compression
+        # ZipInfo.from_file leaves the level unset; use the archive's, as ZipFile.write does
+        info._compresslevel = zipf.compresslevel
+    return info
+
+
+def deflate_file(abs_path, level=ZIP_COMPRESSLEVEL):
+    """Deflates a whole file in a worker thread (zlib releases the GIL); returns (data, crc, size)"""
+    with open(abs_path, "rb") as f:
+        raw = f.read()
+    if _libdeflate is not None:
+        # Emits a raw deflate stream, the same format zlib produces below
+        return _libdeflate.deflate_compress(raw, level), crc32(raw), len(raw)
+    # wbits=-15: raw deflate stream, which is what a ZIP entry stores
+    comp = zlib.compressobj(level, zlib.DEFLATED, -15)
+    return comp.compress(raw) + comp.flush(), crc32(raw), len(raw)
+
+
+def write_deflated_to_zip(zipf, abs_path, arcname, data, crc, size):
+    """Appends an entry whose raw deflate stream was already produced by deflate_file"""
+    info = zipfile.ZipInfo.from_file(abs_path, arcname)
+    info.compress_type = zipfile.ZIP_DEFLATED
+    info.CRC = crc
+    info.file_size = size
+    info.compress_size = len(data)
+    zip64 = size > zipfile.ZIP64_LIMIT or len(data) > zipfile.ZIP64_LIMIT
+    # zipfile has no public API for pre-compressed data; mirror what ZipFile.write does internally
+    zipf._writecheck(info)
+    zipf._didModify = True
+    info.header_offset = zipf.fp.tell()
+    zipf.fp.write(info.FileHeader(zip64))
+    zipf.fp.write(data)
+    zipf.filelist.append(info)
+    zipf.NameToInfo[info.filename] = info
+    zipf.start_dir = zipf.fp.tell()
+
+
+def scan_files(folder):
+    """Yields (path, size) for every file under folder, using os.scandir directly instead of os.walk"""
+    stack = [folder]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            # Unreadable folders are skipped, as os.walk does
+            continue
+        with it:
+            for entry in it:
+                # DirEntry caches the type from the directory listing, so no extra stat per name
+                if entry.is_dir():
+                    # Like os.walk, linked folders are not descended into
+                    if not entry.is_symlink():
+                        stack.append(entry.path)
+                else:
+                    try:
+                        size = entry.stat().st_size
+                    except OSError:
+                        # Unreadable: opening it later reports the error
+                        size = 0
+                    yield entry.path, size
+
+
+def iter_zip_items(path, base_path=""):
+    """Yields (abs_path, arcname, size) for a file, or for every file under a folder"""
+    if os.path.isfile(path):
+        arcname = os.path.join(base_path, os.path.basename(path))
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            # Unreadable: opening it later reports the error
+            size = 0
+        yield path, arcname, size
+    elif os.path.isdir(path):
+        # When adding a folder, keep the folder name in the archive
+        folder = os.path.normpath(path)
+        parent = os.path.dirname(folder)
+        # Every scanned path starts with folder, so slicing off the parent prefix gives the
+        # same arcname as os.path.relpath without splitting and comparing both paths per file
+        prefix_len = len(os.path.join(parent, "")) if parent else 0
+        for abs_path, size in scan_files(folder):
+            yield abs_path, abs_path[prefix_len:], size
+
+
+def deflate_in_parallel(abs_path, size):
+    """Small, compressible files are deflated whole on the thread pool; the rest are streamed"""
+    if os.path.splitext(abs_path)[1].lower() in STORED_EXTS:
+        return False
+    return size <= PARALLEL_MAX_FILE_SIZE
+
+
+# --- ZIP Extraction ---
+EXTRACT_BUFFER_SIZE = 1024 * 1024  # Copy buffer per extracted entry; extractall uses shutil's 64KB default
+
+
+def zip_member_target(info, dest):
+    """Maps a ZIP entry to its path under dest, sanitized the same way ZipFile.extract does"""
+    arcname = info.filename.replace("/", os.path.sep)
+    if os.path.altsep:
+        arcname = arcname.replace(os.path.altsep, os.path.sep)
+    # Drop drive letters and empty, "." and ".." components so nothing escapes dest
+    arcname = os.path.splitdrive(arcname)[1]
+    invalid = ("", os.path.curdir, os.path.pardir)
+    arcname = os.path.sep.join(x for x in arcname.split(os.path.sep) if x not in invalid)
+    if os.path.sep == "\\":
+        arcname = zipfile.ZipFile._sanitize_windows_name(arcname, os.path.sep)
+    return os.path.normpath(os.path.join(dest, arcname))
+
+
+def extract_member(zipf, info, target):
+    """Copies one file entry of zipf to target with a large copy buffer"""
+    with zipf.open(info) as src, open(target, "wb") as dst:
+        shutil.copyfileobj(src, dst, EXTRACT_BUFFER_SIZE)
+
+
+def plan_extraction(infos, dest):
+    """Creates every folder the entries need under dest; returns {target path: entry} for the files"""
+    files = {}  # A repeated name keeps the last entry, like extractall
+    made = set()  # Folders already created, so siblings skip the makedirs syscalls
+    for info in infos:
+        target = zip_member_target(info, dest)
+        folder = target if info.is_dir() else os.path.dirname(target)
+        if folder not in made:
+            os.makedirs(folder, exist_ok=True)
+            made.add(folder)
+        if info.is_dir():
+            continue
+        files.pop(target, None)
+        files[target] = info
+    return files
+
+
+CHUNK_SIZE = 1024 * 1024  # 1MB; adjustable
+ENCODE_CHUNK_SIZE = CHUNK_SIZE * 3  # ZIP bytes collected before each Base64 write; whole 3-byte groups encode without padding
+ZIP_CHUNK_SIZE = 16 * 1024 * 1024  # Large files are streamed into the ZIP in 16MB chunks: fewer write/CRC32 calls per file
+READ_AHEAD_DEPTH = 4  # Chunks the reader thread may queue ahead of the deflate loop
+PREVIEW_LIMIT = 256 * 1024  # Longer Base64 outputs show only head and tail in the output box
+SPOOL_MAX_SIZE = 64 * 1024 * 1024  # ZIPs up to 64MB stay in memory, larger ones spill to disk
+GUI_LIMIT = 2 * 1024 * 1024  # Max Base64 length shown in the output box; larger results are saved to file
+PART_SUFFIX = ".part"  # Workers write here and rename on success, so an existing file survives a cancel or crash
+
+TEXT_DEBOUNCE_MS = 150  # Real-time conversion waits for this many ms of quiet input
+LIVE_CONVERT_LIMIT = 1024 * 1024  # Inputs longer than this (chars) are not converted in real time
+PROGRESS_EMIT_BYTES = 32 * 1024 * 1024  # Workers emit progress at most once per 32MB processed...
+PROGRESS_EMIT_INTERVAL = 0.05  # ...or once per 50ms, whichever comes first
+ZIP_SIGNATURES = (b"PK\x03\x04", b"PK\x05\x06")  # Local file header, or the end record of an empty archive
+BASE64_SNIFF_SIZE = 64  # First read when sniffing for the ZIP signature; doubled while only non-alphabet bytes turn up
+BASE64_TAIL_SIZE = 96 * 1024  # Trailing Base64 chars searched for the ZIP end record: a max-size (64KB) comment plus line breaks
+# Every byte outside the Base64 alphabet: bytes.translate(None, NON_BASE64_BYTES) drops, in C,
+# exactly what b64decode(validate=False) would skip
+NON_BASE64_BYTES = bytes(
+    set(range(256))
+    - set(b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/=")
+)
+
+
+def read_ahead(src, chunk_size):
+    """Yields chunks of src while a sidecar thread keeps reading ahead, overlapping disk I/O with deflate"""
+    q = queue.Queue(maxsize=READ_AHEAD_DEPTH)
+    stop = threading.Event()
+
+    def reader():
+        try:
+            while not stop.is_set():
+                chunk = src.read(chunk_size)
+                q.put(chunk)
+                if not chunk:
+                    return
+        except Exception as e:
+            q.put(e)
+
+    t = threading.Thread(target=reader, daemon=True)
+    t.start()
+    try:
+        while True:
+            item = q.get()
+            if isinstance(item, Exception):
+                raise item
+            if not item:
+                return
+            yield item
+    finally:
+        # Stop the reader and drain the queue so a blocked put() can return before src is closed
+        stop.set()
+        while True:
+            try:
+                q.get_nowait()
+            except queue.Empty:
+                break
+        t.join()
+
+
+def base64_looks_like_zip(fin):
+    """Reads fin up to its first Base64 block, decodes only that block and checks it for a ZIP signature"""
+    head = b""
+    size = BASE64_SNIFF_SIZE
+    while len(head) < 8:
+        chunk = fin.read(size)
+        if not chunk:
+            break
+        # Skip blank lines, a BOM and anything else b64decode would skip, so wrapped or
+        # padded input still yields a whole 8-character block
+        head += chunk.translate(None, NON_BASE64_BYTES)
+        size *= 2
+    try:
+        return _b64.b64decode(head[:8], validate=False).startswith(ZIP_SIGNATURES)
+    except ValueError:
+        return False
+
+
+def base64_has_zip_end(b64_tail):
+    """Decodes only the tail of the Base64 data and looks for the ZIP end-of-central-directory record"""
+    # Drop everything b64decode would skip, then align the window to the end of the data
+    tail = bytes(b64_tail[-BASE64_TAIL_SIZE:]).translate(None, NON_BASE64_BYTES)
+    tail = tail[len(tail) % 4 :]
+    try:
+        return ZIP_SIGNATURES[1] in _b64.b64decode(tail, validate=False)
+    except ValueError:
+        return False
+
+
+class ProgressThrottle:
+    """Rate-limits progress signals: emits once per PROGRESS_EMIT_BYTES or PROGRESS_EMIT_INTERVAL"""
+
+    def __init__(self, emit, total):
+        self._emit = emit
+        self._total = total
+        self._last_value = 0
+        self._last_time = time.monotonic()
+
+    def update(self, value):
+        if value - self._last_value >= PROGRESS_EMIT_BYTES:
+            self.flush(value)
+            return
+        now = time.monotonic()
+        if now - self._last_time >= PROGRESS_EMIT_INTERVAL:
+            self.flush(value, now)
+
+    def flush(self, value, now=None):
+        self._emit(min(value, self._total))
+        self._last_value = value
+        self._last_time = time.monotonic() if now is None else now
+
+
+class Base64StreamWriter:
+    """
+    Write-only file object that Base64-encodes everything written to it into path.
+    ZipFile writes the archive straight into it, so no temp ZIP is written and read back;
+    it has no seek(), so ZipFile streams entries with data descriptors instead of seeking back.
+    """
+
+    def __init__(self, path):
+        self._fout = open(path, "wb")
+        self._pending = bytearray()  # Bytes not encoded yet; encoded in whole 3-byte groups
+        self._pos = 0  # Raw bytes written so far; ZipFile uses it for entry offsets
+
+    def write(self, data):
+        n = len(data)
+        self._pos += n
+        pending = self._pending
+        if n < ENCODE_CHUNK_SIZE:
+            # Small writes (headers, small entries) are collected first
+            pending += data
+            if len(pending) >= ENCODE_CHUNK_SIZE:
+                full = len(pending) - len(pending) % 3
+                # Encode straight from the buffer; the view is released before trimming it
+                with memoryview(pending) as mv:
+                    self._fout.write(_b64.b64encode(mv[:full]))
+                del pending[:full]
+            return n
+
+        # Large writes are encoded from the caller's buffer without copying them into pending:
+        # only the 0-2 bytes that complete pending's last group and the 0-2 trailing bytes move
+        with memoryview(data) as mv:
+            head = -len(pending) % 3
+            pending += mv[:head]
+            tail = n - (n - head) % 3
+            write = self._fout.write
+            write(_b64.b64encode(pending))
+            write(_b64.b64encode(mv[head:tail]))
+            pending[:] = mv[tail:]
+        return n
+
+    def tell(self):
+        return self._pos
+
+    def flush(self):
+        self._fout.flush()
+
+    def close(self):
+        if self._fout.closed:
+            return
+        try:
+            # The last group is the only one that may need padding
+            self._fout.write(_b64.b64encode(self._pending))
+            self._pending.clear()
+        finally:
+            self._fout.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class ZipAndEncodeWorker(QObject):
+    # stage: displays current stage text; rangeChanged: sets max value; progress: updates current value (bytes)
+    stage = pyqtSignal(str)
+    rangeChanged = pyqtSignal(int)
+    progress = pyqtSignal(int)
+    finished = pyqtSignal(str)  # Returns the output file path (Base64.txt)
+    error = pyqtSignal(str)
+    canceled = pyqtSignal()
+
+    def __init__(self, items, save_path, compresslevel=ZIP_COMPRESSLEVEL):
+        """
+        items: List[Tuple[abs_path:str, arcname:str, size:int]], as built by iter_zip_items
+        save_path: Base64.txt desired output path
+        compresslevel: Deflate level, or None to store files without compression
+        """
+        super().__init__()
+        self.items = items
+        self.save_path = save_path
+        self.compresslevel = compresslevel
+        self._cancel = False
+
+    def request_cancel(self):
+        self._cancel = True
+
+    def _calc_total_bytes(self):
+        # Sizes were recorded while scanning, so no file is stat'ed again
+        return sum(size for _, _, size in self.items)
+
+    def run(self):
+        try:
+            # -------- ZIP and Base64 in one pass (read-while-compressing, encode-while-writing) --------
+            self.stage.emit(T("Compressing files/folders..."))
+            total_bytes = self._calc_total_bytes()
+            self.rangeChanged.emit(max(1, total_bytes))
+
+            self._processed = 0
+            self._throttle = ProgressThrottle(self.progress.emit, total_bytes)
+            failed = None
+            workers = os.cpu_count() or 1
+            level = self.compresslevel
+            # No level means "Store": every entry is written without compression
+            compression = zipfile.ZIP_STORED if level is None else zipfile.ZIP_DEFLATED
+            # ZIP and Base64 are one pass: the archive is encoded into save_path as it is written.
+            # On exit the pool stops first, then ZipFile writes the central directory, then the
+            # writer encodes the final group
+            part_path = self.save_path + PART_SUFFIX
+            with Base64StreamWriter(part_path) as b64_out, zipfile.ZipFile(
+                b64_out, "w", compression=compression, compresslevel=level
+            ) as zipf, ThreadPoolExecutor(max_workers=workers) as pool:
+                # Small files are read and deflated ahead on the pool so several reads are in flight at once;
+                # entries are still written in item order
+                items = iter(self.items)
+                pending = deque()
+                while True:
+                    while len(pending) <= workers * 2:
+                        item = next(items, None)
+                        if item is None:
+                            break
+                        abs_path, arcname, size = item
+                        future = None
+                        if level is not None and deflate_in_parallel(abs_path, size):
+                            future = pool.submit(deflate_file, abs_path, level)
+                        pending.append((abs_path, arcname, future))
+                    if not pending or self._cancel:
+                        break
+
+                    abs_path, arcname, future = pending.popleft()
+                    try:
+                        if not self._write_entry(zipf, abs_path, arcname, future):
+                            break
+                    except Exception as e:
+                        log.exception("Error compressing file: %s", abs_path)
+                        failed = T("Error compressing file: {path}\n{error}").format(
+                            path=abs_path, error=e
+                        )
+                        break
+                if self._cancel or failed:
+                    # Drop queued deflates; shutdown(cancel_futures=True) would need Python 3.9
+                    for _, _, future in pending:
+                        if future is not None:
+                            future.cancel()
+                    pool.shutdown(wait=False)
+
+            self._throttle.flush(self._processed)
+
+            # The output file is closed here, so a partial one can be removed
+            if failed:
+                self.error.emit(failed)
+                self._cleanup(part_path)
+                return
+            if self._cancel:
+                self._cleanup(part_path)
+                self.canceled.emit()
+                return
+
+            os.replace(part_path, self.save_path)
+            self.finished.emit(self.save_path)
+
+        except Exception as e:
+            log.exception("ZIP-and-encode worker failed")
+            self._cleanup(self.save_path + PART_SUFFIX)
+            self.error.emit(str(e))
+
+    def _write_entry(self, zipf, abs_path, arcname, future):
+        """Writes one entry to the ZIP; returns False if canceled while streaming a large file"""
+        if future is not None:
+            data, crc, size = future.result()
+            write_deflated_to_zip(zipf, abs_path, arcname, data, crc, size)
+            self._processed += size
+            self._throttle.update(self._processed)
+            return True
+
+        # Stream write single file; reads overlap with deflate via read_ahead
+        info = zip_info_for(zipf, abs_path, arcname)
+        with open(abs_path, "rb") as src, zipf.open(
+            info, "w", force_zip64=True
+        ) as dst, closing(read_ahead(src, ZIP_CHUNK_SIZE)) as chunks:
+            # Bind hot lookups to locals once instead of on every chunk
+            write = dst.write
+            update = self._throttle.update
+            processed = self._processed
+            for chunk in chunks:
+                if self._cancel:
+                    return False
+                write(chunk)
+                processed += len(chunk)
+                update(processed)
+            self._processed = processed
+        return True
+
+    def _cleanup(self, part_path):
+        try:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+        except Exception:
+            pass
+
+
+class DecodeBase64Worker(QObject):
+    stage = pyqtSignal(str)
+    rangeChanged = pyqtSignal(int)
+    progress = pyqtSignal(int)
+    finished = pyqtSignal(object)  # Returns the decoded ZIP as a seekable file object (caller closes it)
+    error = pyqtSignal(str)
+    canceled = pyqtSignal()
+
+    def __init__(self, base64_path=None, text=None):
+        """
+        base64_path: Base64 file to decode
+        text: Pasted Base64 text, decoded instead of a file when given
+        """
+        super().__init__()
+        self.base64_path = base64_path
+        self.text = text
+        self._cancel = False
+
+    def request_cancel(self):
+        self._cancel = True
+
+    def run(self):
+        spool = None
+        try:
+            # -------- Stage 1: Read Base64 file and stream decode to ZIP --------
+            self.stage.emit(T("Decoding Base64 (Reading)..."))
+            if self.text is not None:
+                # Non-ASCII characters can never be valid Base64; BytesIO wraps the bytes without a copy
+                data = self.text.encode("ascii", "ignore")
+                self.text = None
+                source = io.BytesIO(data)
+                total = len(data)
+                del data
+            else:
+                source = open(self.base64_path, "rb")
+                total = os.path.getsize(self.base64_path)
+            self.rangeChanged.emit(max(1, total))
+            processed = 0
+            throttle = ProgressThrottle(self.progress.emit, total)
+
+            spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+
+            remain = bytearray()
+            with source as fin:
+                # Bind hot lookups to locals once instead of on every chunk
+                read = fin.read
+                write = spool.write
+                decode = _b64.b64decode
+                update = throttle.update
+                # Reject non-ZIP input from its first block before decoding the whole file
+                looks_like_zip = base64_looks_like_zip(fin)
+                # A truncated paste/file is missing the end record; catch it from the tail too
+                fin.seek(max(0, total - BASE64_TAIL_SIZE))
+                if not (looks_like_zip and base64_has_zip_end(read())):
+                    self._cleanup(spool)
+                    self.error.emit(T("Decoded content is not a valid ZIP archive."))
+                    return
+                fin.seek(0)
+                while True:
+                    if self._cancel:
+                        self._cleanup(spool)
+                        self.canceled.emit()
+                        return
+                    chunk = read(CHUNK_SIZE * 2)  # Read larger chunks for text
+                    if not chunk:
+                        break
+                    # Line breaks (wrapped or hand-edited files) would shift the 4-character groups;
+                    # drop them and any other non-alphabet bytes first. Unwrapped input passes through unchanged
+                    clean = chunk.translate(None, NON_BASE64_BYTES)
+                    # Base64 is grouped in 4 characters; remain carries at most 3 of them.
+                    # Complete the carried group from the front of this chunk...
+                    head = 0
+                    if remain:
+                        head = min(-len(remain) % 4, len(clean))
+                        remain += clean[:head]
+                        if len(remain) == 4:
+                            write(decode(remain, validate=False))
+                            remain.clear()
+                    # ...then decode the rest straight from the chunk, carrying only its 0-3 trailing characters
+                    full = head + (len(clean) - head) // 4 * 4
+                    if full > head:
+                        with memoryview(clean) as mv:
+                            write(decode(mv[head:full], validate=False))
+                    remain += clean[full:]
+                    processed += len(chunk)
+                    update(processed)
+                throttle.flush(processed)
+                # Finalize
+                if remain:
+                    try:
+                        spool.write(_b64.b64decode(remain, validate=False))
+                    except Exception:
+                        # A truncated last group cannot be decoded; the ZIP check below reports it
+                        pass
+
+            # -------- Stage 2: Validate ZIP --------
+            self.stage.emit(T("Validating ZIP file..."))
+            self.rangeChanged.emit(1)
+            self.progress.emit(0)
+            ok = zipfile.is_zipfile(spool)
+            self.progress.emit(1)
+            if not ok:
+                self._cleanup(spool)
+                self.error.emit(T("Decoded content is not a valid ZIP archive."))
+                return
+
+            spool.seek(0)
+            self.finished.emit(spool)
+
+        except Exception as e:
+            log.exception("Base64 decode worker failed")
+            self._cleanup(spool)
+            self.error.emit(str(e))
+
+    def _cleanup(self, spool):
+        if spool is not None:
+            spool.close()
+
+
+class SaveFileWorker(QObject):
+    """Copies a decoded ZIP file object to disk off the GUI thread"""
+
+    stage = pyqtSignal(str)
+    rangeChanged = pyqtSignal(int)
+    progress = pyqtSignal(int)
+    finished = pyqtSignal(str)  # Returns the saved ZIP path
+    error = pyqtSignal(str)
+    canceled = pyqtSignal()
+
+    def __init__(self, src, save_path):
+        super().__init__()
+        self.src = src
+        self.save_path = save_path
+        self._cancel = False
+
+    def request_cancel(self):
+        self._cancel = True
+
+    def run(self):
+        try:
+            self.stage.emit(T("Saving ZIP file..."))
+            src = self.src
+            total = src.seek(0, os.SEEK_END)
+            src.seek(0)
+            self.rangeChanged.emit(max(1, total))
+            throttle = ProgressThrottle(self.progress.emit, total)
+            processed = 0
+
+            part_path = self.save_path + PART_SUFFIX
+            with open(part_path, "wb") as fout:
+                read = src.read
+                write = fout.write
+                while not self._cancel:
+                    buf = read(CHUNK_SIZE)
+                    if not buf:
+                        break
+                    write(buf)
+                    processed += len(buf)
+                    throttle.update(processed)
+                throttle.flush(processed)
+
+            if self._cancel:
+                self._cleanup(part_path)
+                self.canceled.emit()
+                return
+            os.replace(part_path, self.save_path)
+            self.finished.emit(self.save_path)
+
+        except Exception as e:
+            log.exception("Saving the decoded ZIP failed")
+            self._cleanup(self.save_path + PART_SUFFIX)
+            self.error.emit(str(e))
+
+    def _cleanup(self, part_path):
+        try:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+        except Exception:
+            pass
+
+
+class ExtractZipWorker(QObject):
+    """Extracts a decoded ZIP file object into a folder off the GUI thread"""
+
+    stage = pyqtSignal(str)
+    rangeChanged = pyqtSignal(int)
+    progress = pyqtSignal(int)
+    finished = pyqtSignal(int)  # Returns the number of extracted entries
+    error = pyqtSignal(str)
+    canceled = pyqtSignal()
+
+    def __init__(self, src, dest):
+        super().__init__()
+        self.src = src
+        self.dest = dest
+        self._cancel = False
+
+    def request_cancel(self):
+        self._cancel = True
+
+    def run(self):
+        try:
+            self.stage.emit(T("Extracting ZIP file..."))
+            src = self.src
+            if not hasattr(src, "seekable"):
+                # SpooledTemporaryFile only gained seekable() in Python 3.11, and ZipFile needs it to
+                # open entries; its underlying BytesIO or temp file has it on every version
+                src = src._file
+            src.seek(0)
+            with zipfile.ZipFile(src, "r") as zipf:
+                infos = zipf.infolist()
+                files = plan_extraction(infos, self.dest)
+                total = sum(info.file_size for info in files.values())
+                self.rangeChanged.emit(max(1, total))
+                throttle = ProgressThrottle(self.progress.emit, total)
+                processed = 0
+
+                # Folders already exist, so entries are independent; zlib releases the GIL while inflating
+                # and ZipFile serializes the shared reads, so each thread gets its own entry stream
+                with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as pool:
+                    futures = [
+                        (pool.submit(extract_member, zipf, info, target), info.file_size)
+                        for target, info in files.items()
+                    ]
+                    try:
+                        for future, size in futures:
+                            if self._cancel:
+                                break
+                            future.result()
+                            processed += size
+                            throttle.update(processed)
+                    finally:
+                        # On cancel or error, entries that have not started are dropped
+                        # (cancelled one by one: shutdown(cancel_futures=True) needs Python 3.9)
+                        for future, _ in futures:
+                            future.cancel()
+                        pool.shutdown(wait=False)
+                throttle.flush(processed)
+
+            if self._cancel:
+                self.canceled.emit()
+                return
+            self.finished.emit(len(infos))
+
+        except Exception as e:
+            log.exception("Extracting the ZIP failed")
+            self.error.emit(str(e))
+
+
+class TextConvertWorker(QObject):
+    finished = pyqtSignal(int, str, str)  # (generation, input as Base64, input decoded from Base64)
+    error = pyqtSignal(int)  # generation
+
+    def __init__(self, text, generation):
+        """
+        text: Input box content to convert
+        generation: Request number; the GUI drops results of requests that were superseded
+        """
+        super().__init__()
+        self.text = text
+        self.generation = generation
+
+    def run(self):
+        try:
+            b64 = encode_text_to_base64(self.text)
+            decoded = decode_base64_to_text(self.text)
+        except Exception:
+            self.error.emit(self.generation)
+            return
+        self.finished.emit(self.generation, b64, decoded)
+
+
+class WorkerRunnable(QRunnable):
+    """Runs a worker on a QThreadPool thread; the worker itself stays a QObject that carries the signals"""
+
+    def __init__(self, worker):
+        super().__init__()
+        self.worker = worker
+
+    def run(self):
+        self.worker.run()
+
+
+# --- PyQt5 GUI Interface ---
+class Base64Tool(QWidget):
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle("Base64 Studio")
+        self.setMinimumSize(820, 700)
+        self._init_ui()
+        icon = app_icon()
+        if icon is not None:
+            self.setWindowIcon(icon)
+
+    def _init_ui(self):
+        """Initializes user interface components."""
+        main_layout = QVBoxLayout()
+
+        # Input Area
+        input_header_layout = QHBoxLayout()
+        input_header_layout.addWidget(QLabel(T("Input Area: (Enter Text or Base64 String)")))
+        input_header_layout.addStretch()
+        # Inputs over LIVE_CONVERT_LIMIT are only converted on request
+        btn_convert = QPushButton(T("Convert"))
+        btn_convert.setObjectName("CopyButton")
+        btn_convert.clicked.connect(self._convert_now)
+        input_header_layout.addWidget(btn_convert)
+        main_layout.addLayout(input_header_layout)
+        self.text_input = QTextEdit()
+        # Pasted HTML is taken as plain text: no rich-text parsing or layout of large pastes
+        self.text_input.setAcceptRichText(False)
+        self.text_input.textChanged.connect(self._on_text_changed)
+        main_layout.addWidget(self.text_input)
+
+        # Coalesce bursts of textChanged (typing/pasting) into a single conversion
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.timeout.connect(self._do_convert)
+        # Bumped on every input change; conversions finishing for an older input are ignored
+        self._convert_gen = 0
+        self._last_input = ""  # Input of the latest conversion; None once the outputs no longer show it
+
+        # Base64 Output Area
+        b64_output_header_layout = QHBoxLayout()
+        b64_output_header_layout.addWidget(QLabel(T("Base64 Encoded Output:")))
+        b64_output_header_layout.addStretch()
+        btn_copy_b64 = QPushButton(T("Copy"))
+        btn_copy_b64.setObjectName("CopyButton")
+        btn_copy_b64.clicked.connect(self._copy_b64_output)
+        b64_output_header_layout.addWidget(btn_copy_b64)
+        main_layout.addLayout(b64_output_header_layout)
+        self.output_b64 = QPlainTextEdit()
+        self.output_b64.setReadOnly(True)
+        # Plain-text widgets: no rich-text layout, no undo snapshots of every result
+        self.output_b64.setUndoRedoEnabled(False)
+        # Base64 has no natural line breaks; wrapping one huge line dominates layout time
+        self.output_b64.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self._full_b64 = ""  # Full Base64 output; the box may only hold a preview of it
+        main_layout.addWidget(self.output_b64)
+
+        # Text Decoded Output Area
+        text_output_header_layout = QHBoxLayout()
+        text_output_header_layout.addWidget(QLabel(T("Text Decoded Output:")))
+        text_output_header_layout.addStretch()
+        btn_copy_text = QPushButton(T("Copy"))
+        btn_copy_text.setObjectName("CopyButton")
+        btn_copy_text.clicked.connect(self._copy_text_output)
+        text_output_header_layout.addWidget(btn_copy_text)
+        main_layout.addLayout(text_output_header_layout)
+        self.output_text = QPlainTextEdit()
+        self.output_text.setReadOnly(True)
+        self.output_text.setUndoRedoEnabled(False)
+        self._last_text = ""  # Last decoded text shown; Copy uses it instead of walking the document
+        main_layout.addWidget(self.output_text)
+
+        # Compression level used by every "Compress" button
+        compress_layout = QHBoxLayout()
+        compress_layout.addWidget(QLabel(T("Compression:")))
+        self.compress_combo = QComboBox()
+        for label, level in COMPRESSION_LEVELS:
+            self.compress_combo.addItem(T(label), level)
+        compress_layout.addWidget(self.compress_combo)
+        compress_layout.addStretch()
+        main_layout.addLayout(compress_layout)
+
+        # Status Label
+        self.status_label = QLabel(T("Ready..."))
+        if _b64 is not base64:
+            # Shows which SIMD kernel libbase64 picked on this CPU, e.g. "... (C extension active - AVX2)"
+            self.status_label.setText(
+                T("Ready... Base64 codec: pybase64 {version}").format(
+                    version=_b64.get_version()
+                )
+            )
+        main_layout.addWidget(self.status_label)
+
+        # Original File Operations Group (Standard)
+        file_group = QGroupBox(T("File Compression & Decoding (Standard)"))
+        file_layout = QHBoxLayout()
+
+        btn_files_to_b64 = QPushButton(T("Select Files → Compress → Base64"))
+        btn_files_to_b64.clicked.connect(self._files_to_base64_zip)
+        file_layout.addWidget(btn_files_to_b64)
+
+        btn_folders_to_b64 = QPushButton(T("Select Folder → Compress → Base64"))
+        btn_folders_to_b64.clicked.connect(self._folders_to_base64_zip)
+        file_layout.addWidget(btn_folders_to_b64)
+
+        btn_b64_to_file = QPushButton(T("Base64 → Decode to File..."))
+        btn_b64_to_file.clicked.connect(self._handle_base64_to_file)
+        file_layout.addWidget(btn_b64_to_file)
+
+        file_group.setLayout(file_layout)
+        main_layout.addWidget(file_group)
+
+        # New Large File Handling Group (Behavior: compress directly asks to save Base64.txt; decode reads from Base64.txt)
+        large_group = QGroupBox(
+            T("Large File Processing (Stream Save/Load Base64.txt)")
+        )
+        large_layout = QHBoxLayout()
+
+        btn_large_files_to_b64 = QPushButton(T("Select Files → Save Base64.txt"))
+        btn_large_files_to_b64.clicked.connect(self._large_files_to_base64_save)
+        large_layout.addWidget(btn_large_files_to_b64)
+
+        btn_large_folders_to_b64 = QPushButton(T("Select Folder → Save Base64.txt"))
+        btn_large_folders_to_b64.clicked.connect(self._large_folders_to_base64_save)
+        large_layout.addWidget(btn_large_folders_to_b64)
+
+        btn_large_b64_to_file = QPushButton(T("Decode from Base64.txt to File"))
+        btn_large_b64_to_file.clicked.connect(self._large_base64_file_to_file)
+        large_layout.addWidget(btn_large_b64_to_file)
+
+        large_group.setLayout(large_layout)
+        main_layout.addWidget(large_group)
+
+        self.setLayout(main_layout)
+
+    def _on_large_save_done(self, progress, worker, status_text):
+        progress.close()
+        worker.deleteLater()
+        QMessageBox.information(self, T("Success"), T("Operation completed!"))
+        self.status_label.setText(status_text)
+        self.text_input.clear()
+        self._set_b64_output("")
+        self._set_text_output("")
+
+    def _on_large_error(self, progress, worker, msg):
+        progress.close()
+        worker.deleteLater()
+        QMessageBox.critical(self, T("Error"), msg)
+        self.status_label.setText(T("Processing failed"))
+
+    def _on_large_canceled(self, progress, worker):
+        progress.close()
+        worker.deleteLater()
+        QMessageBox.information(
+            self, T("Canceled"), T("Operation stopped and partial files cleaned up.")
+        )
+        self.status_label.setText(T("Operation canceled"))
+
+    def _start_worker(self, worker):
+        # Pooled threads are reused across jobs instead of spinning up a QThread each time
+        QThreadPool.globalInstance().start(WorkerRunnable(worker))
+
+    def _make_progress_dialog(self, title: str) -> QProgressDialog:
+        dlg = QProgressDialog(title, T("Cancel"), 0, 100, self)
+        dlg.setWindowModality(Qt.WindowModal)
+        dlg.setAutoClose(False)
+        dlg.setAutoReset(False)
+        dlg.setMinimumDuration(0)
+        return dlg
+
+    def _save_zip_from_file(self, zip_file):
+        """Saves zip_file on the worker; returns True once the worker owns (and will close) it"""
+        save_path, _ = QFileDialog.getSaveFileName(
+            self, T("Save as ZIP File"), "", T("ZIP Files (*.zip);;All Files (*)")
+        )
+        if not save_path:
+            self.status_label.setText(T("Save operation canceled"))
+            return False
+
+        worker = SaveFileWorker(zip_file, save_path)
+
+        progress = self._make_progress_dialog(T("Processing (Non-blocking UI)..."))
+        progress.setLabelText(T("Preparing..."))
+        progress.setRange(0, 0)
+
+        worker.stage.connect(progress.setLabelText)
+        worker.rangeChanged.connect(lambda m: progress.setRange(0, m))
+        worker.progress.connect(progress.setValue)
+        # The ZIP is released first, whichever way the save ends
+        worker.finished.connect(lambda _: zip_file.close())
+        worker.error.connect(lambda _: zip_file.close())
+        worker.canceled.connect(zip_file.close)
+        worker.finished.connect(lambda p: self._on_zip_saved(progress, worker, p))
+        worker.error.connect(
+            lambda msg: self._on_large_error(progress, worker, msg)
+        )
+        worker.canceled.connect(
+            lambda: self._on_large_canceled(progress, worker)
+        )
+
+        progress.canceled.connect(worker.request_cancel)
+
+        self._start_worker(worker)
+        return True
+
+    def _on_zip_saved(self, progress, worker, save_path):
+        progress.close()
+        worker.deleteLater()
+        QMessageBox.information(
+            self,
+            T("Success"),
+            T("File saved:\n{path}").format(path=os.path.normpath(save_path)),
+        )
+        self.status_label.setText(
+            T("Saved: {name}").format(name=os.path.basename(save_path))
+        )
+        self.text_input.clear()
+        self._set_b64_output("")
+        self._set_text_output("")
+
+    def _extract_zip_from_file(self, zip_file):
+        """Extracts zip_file on the worker; returns True once the worker owns (and will close) it"""
+        extract_path = QFileDialog.getExistingDirectory(
+            self, T("Select Extraction Folder")
+        )
+        if not extract_path:
+            self.status_label.setText(T("Extraction operation canceled"))
+            return False
+
+        worker = ExtractZipWorker(zip_file, extract_path)
+
+        progress = self._make_progress_dialog(T("Processing (Non-blocking UI)..."))
+        progress.setLabelText(T("Preparing..."))
+        progress.setRange(0, 0)
+
+        worker.stage.connect(progress.setLabelText)
+        worker.rangeChanged.connect(lambda m: progress.setRange(0, m))
+        worker.progress.connect(progress.setValue)
+        # The ZIP is released first, whichever way the extraction ends
+        worker.finished.connect(lambda _: zip_file.close())
+        worker.error.connect(lambda _: zip_file.close())
+        worker.canceled.connect(zip_file.close)
+        worker.finished.connect(
+            lambda count: self._on_zip_extracted(progress, worker, count, extract_path)
+        )
+        worker.error.connect(
+            lambda msg: self._on_extract_error(progress, worker, msg)
+        )
+        worker.canceled.connect(
+            lambda: self._on_extract_canceled(progress, worker)
+        )
+
+        progress.canceled.connect(worker.request_cancel)
+
+        self._start_worker(worker)
+        return True
+
+    def _on_zip_extracted(self, progress, worker, count, extract_path):
+        progress.close()
+        worker.deleteLater()
+        QMessageBox.information(
+            self,
+            T("Success"),
+            T("Extracted {count} files to:\n{path}").format(
+                count=count, path=os.path.normpath(extract_path)
+            ),
+        )
+        self.status_label.setText(
+            T("Extracted to: {name}").format(name=os.path.basename(extract_path))
+        )
+        self.text_input.clear()
+        self._set_b64_output("")
+        self._set_text_output("")
+
+    def _on_extract_error(self, progress, worker, msg):
+        progress.close()
+        worker.deleteLater()
+        QMessageBox.critical(self, T("Extraction Failed"), msg)
+        self.status_label.setText(T("Extraction failed"))
+
+    def _on_extract_canceled(self, progress, worker):
+        progress.close()
+        worker.deleteLater()
+        self.status_label.setText(
+            T("Extraction stopped; files already extracted were kept.")
+        )
+
+    # ---------- Copy Button Functions ----------
+    def _set_b64_output(self, b64: str):
+        """Shows Base64 output; long results only show head and tail, the full text is kept for Copy"""
+        self._full_b64 = b64
+        if len(b64) <= PREVIEW_LIMIT:
+            self.output_b64.setPlainText(b64)
+            return
+        edge = PREVIEW_LIMIT // 2
+        omitted = len(b64) - 2 * edge
+        self.output_b64.setPlainText(
+            T("{head}\n…[{omitted:,} chars omitted]…\n{tail}").format(
+                head=b64[:edge], omitted=omitted, tail=b64[-edge:]
+            )
+        )
+
+    def _copy_b64_output(self):
+        """Copies the full Base64 output (not just the preview) to the clipboard."""
+        content = self._full_b64
+        if content:
+            QApplication.clipboard().setText(content)
+            self.status_label.setText(T("Base64 output copied to clipboard!"))
+        else:
+            self.status_label.setText(
+                T("Base64 output area is empty, nothing to copy.")
+            )
+
+    def _set_text_output(self, text: str):
+        """Shows decoded text and caches it for Copy"""
+        self._last_text = text
+        self.output_text.setPlainText(text)
+
+    def _copy_text_output(self):
+        """Copies the content of the text decoded output box to the clipboard."""
+        content = self._last_text
+        if content:
+            QApplication.clipboard().setText(content)
+            self.status_label.setText(T("Text decoded output copied to clipboard!"))
+        else:
+            self.status_label.setText(
+                T("Text decoded output area is empty, nothing to copy.")
+            )
+
+    # ---------- Real-time Text Conversion ----------
+    def _on_text_changed(self):
+        """Schedules a real-time conversion once the input settles (debounced)."""
+        document = self.text_input.document()
+        if document.isEmpty():
+            # Clearing is cheap, handle it immediately so later setText calls are not overwritten
+            self._debounce.stop()
+            self._do_convert()
+            return
+        if document.characterCount() > LIVE_CONVERT_LIMIT:
+            # Re-encoding megabytes on every edit would stall the GUI thread;
+            # characterCount() is O(1), so the text is never copied out of the document
+            self._debounce.stop()
+            self._convert_gen += 1
+            self._last_input = None
+            self._set_b64_output("")
+            self._set_text_output("")
+            self.status_label.setText(
+                T(
+                    'Input too large for real-time conversion; press "Convert" to convert it'
+                )
+            )
+            return
+        self._debounce.start(TEXT_DEBOUNCE_MS)
+
+    def _convert_now(self):
+        """Converts the input right away, whatever its size (the Convert button)."""
+        self._debounce.stop()
+        self._last_input = None  # Convert again even if the input did not change
+        self.status_label.setText(T("Converting..."))
+        self._do_convert()
+
+    def _do_convert(self):
+        """Updates output boxes in real-time based on input content."""
+        input_text = self.text_input.toPlainText().strip()
+        if input_text == self._last_input:
+            # Only whitespace at the ends changed (or nothing): the outputs already match
+            return
+        self._last_input = input_text
+        self._convert_gen += 1
+        if not input_text:
+            self._set_b64_output("")
+            self._set_text_output("")
+            self.status_label.setText(T("Ready..."))
+            return
+
+        # Update both outputs: one is text encoded to Base64, the other attempts to decode input as Base64 back to text.
+        # The conversion runs on the pool so typing stays responsive while it works
+        worker = TextConvertWorker(input_text, self._convert_gen)
+        worker.finished.connect(
+            lambda gen, b64, text: self._on_convert_done(worker, gen, b64, text)
+        )
+        worker.error.connect(lambda gen: self._on_convert_error(worker, gen))
+        self._start_worker(worker)
+
+    def _on_convert_done(self, worker, generation, b64, text):
+        worker.deleteLater()
+        if generation != self._convert_gen:
+            return
+        self._set_b64_output(b64)
+        self._set_text_output(text)
+        self.status_label.setText(T("Real-time conversion complete"))
+
+    def _on_convert_error(self, worker, generation):
+        worker.deleteLater()
+        if generation != self._convert_gen:
+            return
+        self._set_b64_output("")
+        self._set_text_output("")
+        self.status_label.setText(T("Error during conversion"))
+
+    # ---------- Original Files / Folder → Base64 (Display in GUI) ----------
+    def _files_to_base64_zip(self):
+        """Select Files → ZIP → Base64 (Result displayed in output_b64)"""
+        file_paths, _ = QFileDialog.getOpenFileNames(self, T("Select Files"))
+        if not file_paths:
+            return
+        items = [item for p in file_paths for item in iter_zip_items(p)]
+        self._zip_to_base64_output(
+            items,
+            T("Compressed {count} files").format(count=len(file_paths)),
+            "archive_base64.txt",
+        )
+
+    def _folders_to_base64_zip(self):
+        """Select Folder → ZIP → Base64 (Result displayed in output_b64)"""
+        folder_path = QFileDialog.getExistingDirectory(self, T("Select Folder"))
+        if not folder_path:
+            return
+        self._zip_to_base64_output(
+            list(iter_zip_items(folder_path)),
+            T("Compressed folder: {name}").format(name=os.path.basename(folder_path)),
+            f"{os.path.basename(folder_path)}_base64.txt",
+        )
+
+    def _zip_to_base64_output(self, items, summary: str, default_name: str):
+        """Compresses and encodes into a temp Base64 file on the worker, keeping the UI responsive"""
+        fd, b64_path = tempfile.mkstemp(suffix=".txt")
+        os.close(fd)
+
+        worker = ZipAndEncodeWorker(
+            items, b64_path, self.compress_combo.currentData()
+        )
+
+        progress = self._make_progress_dialog(T("Processing (Non-blocking UI)..."))
+        progress.setLabelText(T("Preparing..."))
+        progress.setRange(0, 0)
+
+        worker.stage.connect(progress.setLabelText)
+        worker.rangeChanged.connect(lambda m: progress.setRange(0, m))
+        worker.progress.connect(progress.setValue)
+
+        def discard_temp(*_):
+            # The worker only removes its .part file; the placeholder from mkstemp is ours
+            try:
+                os.remove(b64_path)
+            except OSError:
+                pass
+
+        worker.error.connect(discard_temp)
+        worker.canceled.connect(discard_temp)
+        worker.finished.connect(
+            lambda p: self._on_base64_output_done(
+                progress, worker, p, summary, default_name
+            )
+        )
+        worker.error.connect(
+            lambda msg: self._on_large_error(progress, worker, msg)
+        )
+        worker.canceled.connect(
+            lambda: self._on_large_canceled(progress, worker)
+        )
+
+        progress.canceled.connect(worker.request_cancel)
+
+        self._start_worker(worker)
+
+    def _on_base64_output_done(
+        self, progress, worker, b64_path, summary: str, default_name: str
+    ):
+        """Small results go to output_b64; large ones are moved to a file the user picks"""
+        progress.close()
+        worker.deleteLater()
+        try:
+            b64_len = os.path.getsize(b64_path)
+            if b64_len <= GUI_LIMIT:
+                with open(b64_path, "rb") as f:
+                    base64_result = f.read().decode("ascii")
+                self.text_input.clear()
+                self._set_b64_output(base64_result)
+                self._set_text_output("")
+                self.status_label.setText(
+                    T("{summary}, Base64 length: {length}").format(
+                        summary=summary, length=b64_len
+                    )
+                )
+                return
+
+            QMessageBox.information(
+                self,
+                T("Result Too Large"),
+                T(
+                    "Base64 length is {length}, too large to display.\nPlease choose where to save Base64.txt."
+                ).format(length=b64_len),
+            )
+            save_path, _ = QFileDialog.getSaveFileName(
+                self,
+                T("Save as Base64.txt"),
+                default_name,
+                T("Text Files (*.txt);;All Files (*)"),
+            )
+            if not save_path:
+                self.status_label.setText(T("Save Base64.txt canceled"))
+                return
+            # The Base64 is already on disk; moving it is a rename on the same drive
+            shutil.move(b64_path, save_path)
+            self.text_input.clear()
+            self._set_b64_output("")
+            self._set_text_output("")
+            self.status_label.setText(
+                T("{summary}, Base64 saved: {name}").format(
+                    summary=summary, name=os.path.basename(save_path)
+                )
+            )
+        except Exception as e:
+            QMessageBox.critical(self, T("Error"), str(e))
+            self.status_label.setText(T("Compression failed"))
+        finally:
+            if os.path.exists(b64_path):
+                os.remove(b64_path)
+
+    def _handle_base64_to_file(self):
+        """Base64 (from text input box) → ZIP file or direct extraction (Original behavior)"""
+        # No strip(): the worker's decode and ZIP checks skip whitespace anyway,
+        # so a large paste is not copied once more just to trim it
+        text = self.text_input.toPlainText()
+        if not text or text.isspace():
+            QMessageBox.warning(
+                self, T("Error"), T("Please paste Base64 encoding in the input area.")
+            )
+            return
+
+        # Decoding a large paste takes a while; it runs on the worker like a Base64 file does
+        worker = DecodeBase64Worker(text=text)
+        del text
+
+        progress = self._make_progress_dialog(T("Processing (Non-blocking UI)..."))
+        progress.setLabelText(T("Preparing..."))
+        progress.setRange(0, 0)
+
+        worker.stage.connect(progress.setLabelText)
+        worker.rangeChanged.connect(lambda m: progress.setRange(0, m))
+        worker.progress.connect(progress.setValue)
+        worker.finished.connect(
+            lambda zip_file: self._on_base64_decoded(progress, worker, zip_file)
+        )
+        worker.error.connect(
+            lambda msg: self._on_large_error(progress, worker, msg)
+        )
+        worker.canceled.connect(
+            lambda: self._on_large_canceled(progress, worker)
+        )
+
+        progress.canceled.connect(worker.request_cancel)
+
+        self._start_worker(worker)
+
+    def _on_base64_decoded(self, progress, worker, zip_file):
+        """Asks whether to save or extract the decoded ZIP; takes ownership of zip_file"""
+        # Close progress dialog, return to main thread for subsequent interaction
+        progress.close()
+        worker.deleteLater()
+
+        msg_box = QMessageBox(self)
+        msg_box.setIcon(QMessageBox.Question)
+        msg_box.setWindowTitle(T("Select Operation"))
+        msg_box.setText(
+            T("Successfully validated as a ZIP archive. What would you like to do?")
+        )
+        btn_save_zip = msg_box.addButton(
+            T("Save as ZIP File"), QMessageBox.ActionRole
+        )
+        btn_extract = msg_box.addButton(
+            T("Extract Directly to Folder"), QMessageBox.ActionRole
+        )
+        btn_cancel = msg_box.addButton(T("Cancel"), QMessageBox.RejectRole)
+        msg_box.exec_()
+
+        clicked_button = msg_box.clickedButton()
+        if clicked_button == btn_save_zip:
+            # The save worker now owns the spool and closes it when done
+            if self._save_zip_from_file(zip_file):
+                return
+        elif clicked_button == btn_extract:
+            # Likewise for the extract worker
+            if self._extract_zip_from_file(zip_file):
+                return
+        else:
+            self.status_label.setText(T("Operation canceled"))
+        # Release the spooled zip (removes its temp file if it spilled to disk)
+        zip_file.close()
+
+    # ---------- Large File Section: Compress and Save Directly to Base64.txt ----------
+    def _large_files_to_base64_save(self):
+        file_paths, _ = QFileDialog.getOpenFileNames(
+            self, T("Select Files to Compress (Multi-select supported)")
+        )
+        if not file_paths:
+            return
+
+        save_path, _ = QFileDialog.getSaveFileName(
+            self,
+            T("Save as Base64.txt"),
+            "archive_base64.txt",
+            T("Text Files (*.txt);;All Files (*)"),
+        )
+        if not save_path:
+            self.status_label.setText(T("Save Base64.txt canceled"))
+            return
+
+        # Construct items: (abs_path, arcname, size)
+        items = [item for p in file_paths for item in iter_zip_items(p)]
+
+        worker = ZipAndEncodeWorker(
+            items, save_path, self.compress_combo.currentData()
+        )
+
+        progress = self._make_progress_dialog(T("Processing (Non-blocking UI)..."))
+        progress.setLabelText(T("Preparing..."))
+        progress.setRange(0, 0)  # Unknown range initially
+
+        # Connect signals
+        worker.stage.connect(progress.setLabelText)
+        worker.rangeChanged.connect(lambda m: progress.setRange(0, m))
+        worker.progress.connect(progress.setValue)
+        worker.finished.connect(
+            lambda p: self._on_large_save_done(
+                progress,
+                worker,
+                T("Base64 saved: {name}").format(name=os.path.basename(p)),
+            )
+        )
+        worker.error.connect(lambda msg: self._on_large_error(progress, worker, msg))
+        worker.canceled.connect(lambda: self._on_large_canceled(progress, worker))
+
+        progress.canceled.connect(worker.request_cancel)
+
+        self._start_worker(worker)
+
+    def _large_folders_to_base64_save(self):
+        folder_path = QFileDialog.getExistingDirectory(
+            self, T("Select Folder to Compress")
+        )
+        if not folder_path:
+            return
+
+        save_path, _ = QFileDialog.getSaveFileName(
+            self,
+            T("Save as Base64.txt"),
+            f"{os.path.basename(folder_path)}_base64.txt",
+            T("Text Files (*.txt);;All Files (*)"),
+        )
+        if not save_path:
+            self.status_label.setText(T("Save Base64.txt canceled"))
+            return
+
+        # Flatten all files in the folder, preserving relative paths
+        items = list(iter_zip_items(folder_path))
+
+        worker = ZipAndEncodeWorker(
+            items, save_path, self.compress_combo.currentData()
+        )
+
+        progress = self._make_progress_dialog(T("Processing (Non-blocking UI)..."))
+        progress.setLabelText(T("Preparing..."))
+        progress.setRange(0, 0)
+
+        worker.stage.connect(progress.setLabelText)
+        worker.rangeChanged.connect(lambda m: progress.setRange(0, m))
+        worker.progress.connect(progress.setValue)
+        worker.finished.connect(
+            lambda p: self._on_large_save_done(
+                progress,
+                worker,
+                T("Base64 saved: {name}").format(name=os.path.basename(p)),
+            )
+        )
+        worker.error.connect(lambda msg: self._on_large_error(progress, worker, msg))
+        worker.canceled.connect(lambda: self._on_large_canceled(progress, worker))
+
+        progress.canceled.connect(worker.request_cancel)
+
+        self._start_worker(worker)
+
+    def _large_base64_file_to_file(self):
+        base64_path, _ = QFileDialog.getOpenFileName(
+            self,
+            T("Select Base64.txt File (Generated by Large File Section)"),
+            "",
+            T("Text Files (*.txt);;All Files (*)"),
+        )
+        if not base64_path:
+            return
+
+        worker = DecodeBase64Worker(base64_path)
+
+        progress = self._make_progress_dialog(T("Processing (Non-blocking UI)..."))
+        progress.setLabelText(T("Preparing..."))
+        progress.setRange(0, 0)
+
+        worker.stage.connect(progress.setLabelText)
+        worker.rangeChanged.connect(lambda m: progress.setRange(0, m))
+        worker.progress.connect(progress.setValue)
+        worker.finished.connect(
+            lambda zip_file: self._on_base64_decoded(progress, worker, zip_file)
+        )
+        worker.error.connect(
+            lambda msg: self._on_large_error(progress, worker, msg)
+        )
+        worker.canceled.connect(
+            lambda: self._on_large_canceled(progress, worker)
+        )
+
+        progress.canceled.connect(worker.request_cancel)
+
+        self._start_worker(worker)
+
+
+# ---------- Application Startup ----------
+def main(lang="en"):
+    global LANG
+    LANG = lang
+    QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
+    app = QApplication(sys.argv)
+    app.setStyleSheet(QSS_STYLE)
+    window = Base64Tool()
+    window.show()
+    sys.exit(app.exec_())
+
+
+if __name__ == "__main__":
+    main()